@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Mapping, Optional
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -13,8 +13,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, MODEL, INPUT_REGISTER_MAP, HOLDING_REGISTER_MAP
-from .coordinator import GrantAerona3Coordinator
+from .const import DOMAIN, ALARM_CODES, INPUT_REGISTER_MAP, HOLDING_REGISTER_MAP
+from .coordinator import EMPTY_ATTRIBUTES, EMPTY_REGISTERS, GrantAerona3Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,21 +27,10 @@ async def async_setup_entry(
     """Set up Grant Aerona3 binary sensor entities with ashp_ prefixes."""
     coordinator: GrantAerona3Coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities = []
-
     # Add status binary sensors
-    entities.extend([
-        GrantAerona3CompressorSensor(coordinator, config_entry),
-        GrantAerona3DefrostSensor(coordinator, config_entry),
-        GrantAerona3AlarmSensor(coordinator, config_entry),
-        GrantAerona3HeatingActiveSensor(coordinator, config_entry),
-        GrantAerona3DHWActiveSensor(coordinator, config_entry),
-        GrantAerona3BackupHeaterSensor(coordinator, config_entry),
-        GrantAerona3FrostProtectionSensor(coordinator, config_entry),
-        GrantAerona3WeatherCompActiveSensorZone1(coordinator, config_entry),
-        GrantAerona3WeatherCompActiveSensorZone2(coordinator, config_entry),
-        GrantAerona3CommunicationSensor(coordinator, config_entry),
-    ])
+    entities = [
+        entity_class(coordinator, config_entry) for entity_class in _BINARY_SENSOR_CLASSES
+    ]
 
     _LOGGER.info("Creating %d ASHP binary sensor entities", len(entities))
     async_add_entities(entities)
@@ -58,18 +47,7 @@ class GrantAerona3BaseBinarySensor(CoordinatorEntity, BinarySensorEntity):
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
-
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": "ASHP Grant Aerona3",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-            "configuration_url": f"http://{self._config_entry.data.get('host', '')}",
-        }
+        self._attr_device_info = coordinator.device_info
 
 
 class GrantAerona3CompressorSensor(GrantAerona3BaseBinarySensor):
@@ -91,10 +69,11 @@ class GrantAerona3CompressorSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if compressor is running."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # Check compressor frequency (register 1)
         frequency = input_regs.get(1, 0)
@@ -106,12 +85,13 @@ class GrantAerona3CompressorSensor(GrantAerona3BaseBinarySensor):
         return frequency > 0 or power > 200
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
+        data = self.coordinator.data
+        if not data:
+            return EMPTY_ATTRIBUTES
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         return {
             "compressor_frequency": input_regs.get(1, 0),
             "power_consumption": input_regs.get(3, 0) * 100,  # Convert to watts
@@ -137,10 +117,11 @@ class GrantAerona3DefrostSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if defrost cycle is active."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # Check outdoor temperature and compressor status for defrost detection
         outdoor_temp = input_regs.get(2)
@@ -152,12 +133,13 @@ class GrantAerona3DefrostSensor(GrantAerona3BaseBinarySensor):
         return outdoor_temp <= 5 and frequency == 0
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
+        data = self.coordinator.data
+        if not data:
+            return EMPTY_ATTRIBUTES
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         return {
             "outdoor_temperature": input_regs.get(2, 0) * 0.1 if input_regs.get(2) else None,
             "compressor_frequency": input_regs.get(1, 0),
@@ -183,10 +165,11 @@ class GrantAerona3AlarmSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if alarm is active."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # Check for alarm conditions (adjust register as needed)
         alarm_register = input_regs.get(20, 0)  # Adjust register number
@@ -194,30 +177,21 @@ class GrantAerona3AlarmSensor(GrantAerona3BaseBinarySensor):
         return alarm_register > 0
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
+        data = self.coordinator.data
+        if not data:
+            return EMPTY_ATTRIBUTES
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        alarm_code = data.get("input_registers", EMPTY_REGISTERS).get(20, 0)
         return {
-            "alarm_code": input_regs.get(20, 0),
-            "alarm_description": self._get_alarm_description(input_regs.get(20, 0)),
+            "alarm_code": alarm_code,
+            "alarm_description": self._get_alarm_description(alarm_code),
         }
 
     def _get_alarm_description(self, code: int) -> str:
         """Get alarm description from code."""
-        alarm_codes = {
-            0: "No Alarm",
-            1: "High Pressure",
-            2: "Low Pressure",
-            3: "Compressor Overload",
-            4: "Fan Motor Error",
-            5: "Water Flow Error",
-            6: "Temperature Sensor Error",
-            7: "Communication Error",
-        }
-        return alarm_codes.get(code, f"Unknown Alarm ({code})")
+        return ALARM_CODES.get(code, f"Unknown Alarm ({code})")
 
 
 class GrantAerona3HeatingActiveSensor(GrantAerona3BaseBinarySensor):
@@ -239,11 +213,12 @@ class GrantAerona3HeatingActiveSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if heating is active."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
         
-        input_regs = self.coordinator.data.get("input_registers", {})
-        holding_regs = self.coordinator.data.get("holding_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
+        holding_regs = data.get("holding_registers", EMPTY_REGISTERS)
         
         # Check operation mode and temperatures
         operation_mode = input_regs.get(13, 0)  # Adjust register
@@ -274,10 +249,11 @@ class GrantAerona3DHWActiveSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if DHW heating is active."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         dhw_mode = input_regs.get(13, 0)  
         
@@ -303,10 +279,11 @@ class GrantAerona3BackupHeaterSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if backup heater is active."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # Check backup heater status (adjust logic as needed)
         outdoor_temp = input_regs.get(2)
@@ -336,10 +313,11 @@ class GrantAerona3FrostProtectionSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if frost protection is active."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # Check for frost protection conditions
         outdoor_temp = input_regs.get(2)
@@ -369,10 +347,11 @@ class GrantAerona3WeatherCompActiveSensorZone1(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if weather compensation is active."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
         
-        coil_regs = self.coordinator.data.get("coil_registers", {})
+        coil_regs = data.get("coil_registers", EMPTY_REGISTERS)
         
         weather_comp_enabled = coil_regs.get(2, 0) 
         
@@ -396,10 +375,11 @@ class GrantAerona3WeatherCompActiveSensorZone2(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if weather compensation is active for Zone 2."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
         
-        coil_regs = self.coordinator.data.get("coil_registers", {})
+        coil_regs = data.get("coil_registers", EMPTY_REGISTERS)
         weather_comp_enabled = coil_regs.get(3, 0)  # Changed from 2 to 3
         
         return weather_comp_enabled > 0
@@ -424,26 +404,43 @@ class GrantAerona3CommunicationSensor(GrantAerona3BaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return true if communication is working."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
         
         # Check if we have recent data
-        last_update = self.coordinator.data.get("last_update", 0)
+        last_update = data.get("last_update", 0)
         current_time = self.coordinator.hass.loop.time()
         
         # Communication OK if last update was within 2 minutes
         return (current_time - last_update) < 120
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
+        data = self.coordinator.data
+        if not data:
+            return EMPTY_ATTRIBUTES
         
-        last_update = self.coordinator.data.get("last_update", 0)
+        last_update = data.get("last_update", 0)
         current_time = self.coordinator.hass.loop.time()
         
         return {
             "last_update_seconds_ago": round(current_time - last_update),
             "coordinator_available": self.coordinator.last_update_success,
-        }
\ No newline at end of file
+        }
+
+
+# Status binary sensors created for every config entry
+_BINARY_SENSOR_CLASSES = (
+    GrantAerona3CompressorSensor,
+    GrantAerona3DefrostSensor,
+    GrantAerona3AlarmSensor,
+    GrantAerona3HeatingActiveSensor,
+    GrantAerona3DHWActiveSensor,
+    GrantAerona3BackupHeaterSensor,
+    GrantAerona3FrostProtectionSensor,
+    GrantAerona3WeatherCompActiveSensorZone1,
+    GrantAerona3WeatherCompActiveSensorZone2,
+    GrantAerona3CommunicationSensor,
+)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Mapping, Optional
 
 from homeassistant.components.climate import (
     ClimateEntity,
@@ -18,12 +18,11 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
-    MANUFACTURER,
-    MODEL,
     OPERATING_MODES,
     CLIMATE_MODES,
+    DHW_MODES,
 )
-from .coordinator import GrantAerona3Coordinator
+from .coordinator import EMPTY_ATTRIBUTES, EMPTY_REGISTERS, GrantAerona3Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,14 +35,10 @@ async def async_setup_entry(
     """Set up Grant Aerona3 climate entities with ashp_ prefixes."""
     coordinator: GrantAerona3Coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities = []
-
     # Add climate entities
-    entities.extend([
-        GrantAerona3MainZoneClimate(coordinator, config_entry),
-        GrantAerona3Zone2Climate(coordinator, config_entry),
-        GrantAerona3DHWClimate(coordinator, config_entry),
-    ])
+    entities = [
+        entity_class(coordinator, config_entry) for entity_class in _CLIMATE_CLASSES
+    ]
 
     _LOGGER.info("Creating %d ASHP climate entities", len(entities))
     async_add_entities(entities)
@@ -62,18 +57,7 @@ class GrantAerona3BaseClimate(CoordinatorEntity, ClimateEntity):
         self._config_entry = config_entry
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_precision = 0.5
-
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": "ASHP Grant Aerona3",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-            "configuration_url": f"http://{self._config_entry.data.get('host', '')}",
-        }
+        self._attr_device_info = coordinator.device_info
 
 
 class GrantAerona3MainZoneClimate(GrantAerona3BaseClimate):
@@ -113,10 +97,11 @@ class GrantAerona3MainZoneClimate(GrantAerona3BaseClimate):
     @property
     def current_temperature(self) -> Optional[float]:
         """Return the current temperature."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # FIXED: Use Zone1 room temperature from register 11 (Master remote controller)
         # Reference: Register 11: "Room air set temperature of Zone1(Master)" - Unit: 0.1°C
@@ -136,10 +121,11 @@ class GrantAerona3MainZoneClimate(GrantAerona3BaseClimate):
     @property
     def target_temperature(self) -> Optional[float]:
         """Return the target temperature for Zone 1."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         
-        holding_regs = self.coordinator.data.get("holding_registers", {})
+        holding_regs = data.get("holding_registers", EMPTY_REGISTERS)
         
         # Check if we're in heating or cooling mode to determine which setpoint to use
         current_mode = self._get_current_mode()
@@ -161,10 +147,11 @@ class GrantAerona3MainZoneClimate(GrantAerona3BaseClimate):
 
     def _get_current_mode(self) -> str:
         """Determine current operating mode."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return "heating"
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # FIXED: Check operation mode from input register 10 (Selected operating mode)
         # Reference: Register 10: "Selected operating mode (0=Heating/Cooling OFF, 1=Heating, 2=Cooling)"
@@ -180,10 +167,11 @@ class GrantAerona3MainZoneClimate(GrantAerona3BaseClimate):
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return HVACMode.OFF
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # FIXED: Get operation mode from input register 10
         mode = input_regs.get(10, 0)
@@ -207,10 +195,11 @@ class GrantAerona3MainZoneClimate(GrantAerona3BaseClimate):
     @property
     def hvac_action(self) -> HVACAction:
         """Return current HVAC action."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return HVACAction.OFF
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # FIXED: Check if compressor is running
         frequency = input_regs.get(1, 0)  # Compressor frequency (1Hz scale)
@@ -263,13 +252,14 @@ class GrantAerona3MainZoneClimate(GrantAerona3BaseClimate):
         # Implementation would depend on finding the correct control register
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
+        data = self.coordinator.data
+        if not data:
+            return EMPTY_ATTRIBUTES
         
-        input_regs = self.coordinator.data.get("input_registers", {})
-        holding_regs = self.coordinator.data.get("holding_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
+        holding_regs = data.get("holding_registers", EMPTY_REGISTERS)
         
         return {
             "zone": "Zone 1",
@@ -335,10 +325,11 @@ class GrantAerona3Zone2Climate(GrantAerona3BaseClimate):
     @property
     def target_temperature(self) -> Optional[float]:
         """Return the target temperature for Zone 2."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         
-        holding_regs = self.coordinator.data.get("holding_registers", {})
+        holding_regs = data.get("holding_registers", EMPTY_REGISTERS)
         
         current_mode = self._get_current_mode()
         
@@ -359,10 +350,11 @@ class GrantAerona3Zone2Climate(GrantAerona3BaseClimate):
     @property
     def current_temperature(self) -> Optional[float]:
         """Return the current temperature for Zone 2."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # FIXED: Use Zone2 room temperature from register 12 (Slave remote controller)
         # Reference: Register 12: "Room air set temperature of Zone2(Slave)" - Unit: 0.1°C
@@ -381,10 +373,11 @@ class GrantAerona3Zone2Climate(GrantAerona3BaseClimate):
     def _get_current_mode(self) -> str:
         """Determine current operating mode for Zone 2."""
         # Same logic as Zone 1
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return "heating"
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         mode = input_regs.get(10, 1)  # Register 10: Selected operating mode
         
         if mode == 1:
@@ -398,10 +391,11 @@ class GrantAerona3Zone2Climate(GrantAerona3BaseClimate):
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode for Zone 2."""
         # Zone 2 follows the same system mode as Zone 1
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return HVACMode.OFF
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         mode = input_regs.get(10, 0)  # Register 10: Selected operating mode
         power = input_regs.get(3, 0) * 100  # Current consumption (100W scale)
         frequency = input_regs.get(1, 0)
@@ -419,10 +413,11 @@ class GrantAerona3Zone2Climate(GrantAerona3BaseClimate):
     def hvac_action(self) -> HVACAction:
         """Return current HVAC action for Zone 2."""
         # Similar to Zone 1
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return HVACAction.OFF
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         frequency = input_regs.get(1, 0)
         power = input_regs.get(3, 0) * 100  # Current consumption (100W scale)
         
@@ -459,13 +454,14 @@ class GrantAerona3Zone2Climate(GrantAerona3BaseClimate):
             _LOGGER.error("Failed to set Zone 2 target temperature to %s°C", temperature)
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes for Zone 2."""
-        if not self.coordinator.data:
-            return {}
+        data = self.coordinator.data
+        if not data:
+            return EMPTY_ATTRIBUTES
         
-        input_regs = self.coordinator.data.get("input_registers", {})
-        holding_regs = self.coordinator.data.get("holding_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
+        holding_regs = data.get("holding_registers", EMPTY_REGISTERS)
         
         return {
             "zone": "Zone 2",
@@ -520,10 +516,11 @@ class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
     @property
     def current_temperature(self) -> Optional[float]:
         """Return the current DHW tank temperature."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # FIXED: Get DHW tank temperature from input register 16 (Terminal 7-8)
         # Reference: Register 16: "DHW tank temperature (Terminal 7-8)" - Unit: 0.1°C
@@ -537,14 +534,15 @@ class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
     @property
     def target_temperature(self) -> Optional[float]:
         """Return the target DHW temperature."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         
-        holding_regs = self.coordinator.data.get("holding_registers", {})
+        holding_regs = data.get("holding_registers", EMPTY_REGISTERS)
         
         # FIXED: Check DHW mode from input register 13 to determine which setpoint to use
         # Reference: Register 13: "Selected DHW operating mode (0=disable, 1=Comfort, 2=Economy, 3=Force)"
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         dhw_mode = input_regs.get(13, 1) if input_regs else 1
         
         if dhw_mode == 1:  # Comfort mode
@@ -568,11 +566,12 @@ class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current DHW HVAC mode."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return HVACMode.OFF
         
-        input_regs = self.coordinator.data.get("input_registers", {})
-        holding_regs = self.coordinator.data.get("holding_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
+        holding_regs = data.get("holding_registers", EMPTY_REGISTERS)
         
         # Check DHW priority setting from register 26
         dhw_priority = holding_regs.get(26, 0)
@@ -588,10 +587,11 @@ class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
     @property
     def hvac_action(self) -> HVACAction:
         """Return current DHW HVAC action."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return HVACAction.OFF
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
         
         # Check if DHW heating is active
         current_temp = self.current_temperature or 0
@@ -624,7 +624,8 @@ class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
         register_value = int(temperature * 10)
         
         # Determine which register to write based on current DHW mode
-        input_regs = self.coordinator.data.get("input_registers", {}) if self.coordinator.data else {}
+        data = self.coordinator.data
+        input_regs = data.get("input_registers", EMPTY_REGISTERS) if data else EMPTY_REGISTERS
         dhw_mode = input_regs.get(13, 1)  # Default to comfort mode
         
         if dhw_mode == 1:  # Comfort mode
@@ -665,25 +666,18 @@ class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
             _LOGGER.error("Failed to set DHW HVAC mode to %s", hvac_mode)
 
     @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
-        
-        input_regs = self.coordinator.data.get("input_registers", {})
-        holding_regs = self.coordinator.data.get("holding_registers", {})
-        
-        # FIXED: DHW modes mapping - use correct register 13
-        dhw_modes = {
-            0: "Off",
-            1: "Comfort",
-            2: "Economy", 
-            3: "Boost"
-        }
+        data = self.coordinator.data
+        if not data:
+            return EMPTY_ATTRIBUTES
+        
+        input_regs = data.get("input_registers", EMPTY_REGISTERS)
+        holding_regs = data.get("holding_registers", EMPTY_REGISTERS)
         
         return {
             # FIXED: DHW mode from input register 13, not holding register 42
-            "dhw_mode": dhw_modes.get(input_regs.get(13, 0), "Unknown"),
+            "dhw_mode": DHW_MODES.get(input_regs.get(13, 0), "Unknown"),
             "tank_temperature": self.current_temperature,
             "heating_active": self.hvac_action == HVACAction.HEATING,
             # FIXED: Power consumption from input register 3 with 100W scale
@@ -694,4 +688,12 @@ class GrantAerona3DHWClimate(GrantAerona3BaseClimate):
             "economy_setpoint": holding_regs.get(29, 0) / 10 if holding_regs.get(29) else None,
             "boost_setpoint": holding_regs.get(31, 0) / 10 if holding_regs.get(31) else None,
             "dhw_hysteresis": holding_regs.get(30, 0) / 10 if holding_regs.get(30) else None,
-        }
\ No newline at end of file
+        }
+
+
+# Climate entities created for every config entry
+_CLIMATE_CLASSES = (
+    GrantAerona3MainZoneClimate,
+    GrantAerona3Zone2Climate,
+    GrantAerona3DHWClimate,
+)
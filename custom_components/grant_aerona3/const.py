@@ -1,4 +1,6 @@
 """Constants for Grant Aerona3 Heat Pump integration with ASHP prefixes."""
+import sys
+
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.const import (
@@ -34,6 +36,43 @@ DHW_MODES = {
     3: "Boost"
 }
 
+# DHW production priority (holding register 26)
+DHW_PRIORITY_MODES = {
+    0: "DHW is unavailable",
+    1: "DHW priority over space heating",
+    2: "Space heating priority over DHW"
+}
+
+# DHW heating configuration (holding register 27)
+DHW_CONFIGURATION_MODES = {
+    0: "Heat pump + Heater",
+    1: "Heat pump only",
+    2: "Heater only"
+}
+
+# Backup heater type of function (holding register 71)
+BACKUP_HEATER_MODES = {
+    0: "Disabled",
+    1: "Replacement mode",
+    2: "Emergency mode",
+    3: "Supplementary mode"
+}
+
+# Freeze protection functions (holding register 81)
+FROST_PROTECTION_MODES = {
+    0: "Disabled",
+    1: "Enabled during Start-up",
+    2: "Enabled during Defrost",
+    3: "Enabled during Start-up and Defrost"
+}
+
+# EHS type of function (holding register 84)
+EHS_MODES = {
+    0: "Disabled",
+    1: "Replacement mode",
+    2: "Supplementary mode"
+}
+
 # Days of the week
 DAYS_OF_WEEK = {
     0: "Monday",
@@ -73,6 +112,18 @@ ERROR_CODES = {
     15: "Defrost Sensor Error"
 }
 
+# Alarm status descriptions (input register 20)
+ALARM_CODES = {
+    0: "No Alarm",
+    1: "High Pressure",
+    2: "Low Pressure",
+    3: "Compressor Overload",
+    4: "Fan Motor Error",
+    5: "Water Flow Error",
+    6: "Temperature Sensor Error",
+    7: "Communication Error",
+}
+
 # Configuration keys
 CONF_HOST = "host"
 CONF_PORT = "port"
@@ -83,6 +134,16 @@ CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_PORT = 502
 DEFAULT_SLAVE_ID = 1
 DEFAULT_SCAN_INTERVAL = 30
+DEFAULT_FLOW_RATE = 30.0  # L/min, typical for residential Grant Aerona3
+
+# Delay before re-reading the heat pump after a write (seconds)
+REQUEST_REFRESH_COOLDOWN = 0.3
+
+# Window for coalescing queued holding register writes (seconds)
+WRITE_BATCH_DELAY = 0.05
+
+# Largest register count the Modbus spec allows in one read request
+MODBUS_MAX_READ_REGISTERS = 125
 
 # Register types
 INPUT_REGISTERS = "input"
@@ -1132,6 +1193,36 @@ HOLDING_REGISTER_MAP = {
     },
 }
 
+# Name keywords that select holding register ranges, icons and tooltips.
+# Resolved once into a "tags" frozenset per register so entities do set
+# membership checks instead of rescanning the display name.
+HOLDING_REGISTER_TAGS = (
+    "dhw",
+    "outdoor",
+    "mode",
+    "type",
+    "function",
+    "time",
+    "delay",
+    "temp",
+    "hysteresis",
+    "flow",
+    "weather compensation",
+    "frost protection",
+)
+
+
+def _tag_holding_registers() -> None:
+    """Add the "tags" frozenset to every holding register config."""
+    for register_config in HOLDING_REGISTER_MAP.values():
+        name_lower = register_config["name"].lower()
+        register_config["tags"] = frozenset(
+            tag for tag in HOLDING_REGISTER_TAGS if tag in name_lower
+        )
+
+
+_tag_holding_registers()
+
 # Coil Registers (Read/Write boolean controls)
 COIL_REGISTER_MAP = {
     1: {
@@ -1294,4 +1385,18 @@ COIL_REGISTER_MAP = {
         "device_class": None,
         "description": "Terminal 46 : DHW Electric heater or Backup heater (0=DHW Electric heater, 1=Backup heater)"
     },
-}
\ No newline at end of file
+}
+
+
+# Names and descriptions are copied into entity names, ids and attributes;
+# interning them once here lets every copy share a single string object
+def _intern_register_strings() -> None:
+    """Intern the name and description of every register config."""
+    for register_map in (INPUT_REGISTER_MAP, HOLDING_REGISTER_MAP, COIL_REGISTER_MAP):
+        for register_config in register_map.values():
+            for field in ("name", "description"):
+                if field in register_config:
+                    register_config[field] = sys.intern(register_config[field])
+
+
+_intern_register_strings()
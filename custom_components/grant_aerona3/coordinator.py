@@ -4,27 +4,108 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import timedelta
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from pymodbus.client import ModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     DOMAIN,
+    MANUFACTURER,
+    MODEL,
     CONF_SLAVE_ID,
     CONF_SCAN_INTERVAL,
     INPUT_REGISTER_MAP,
     HOLDING_REGISTER_MAP,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_FLOW_RATE,
+    MODBUS_MAX_READ_REGISTERS,
+    REQUEST_REFRESH_COOLDOWN,
+    WRITE_BATCH_DELAY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only default for missing register blocks, so entity lookups
+# do not allocate a fresh empty dict on every call
+EMPTY_REGISTERS: Mapping[int, int] = MappingProxyType({})
+
+# Shared read-only state attributes for entities with nothing to report
+EMPTY_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+
+
+def register_converter(scale: float, offset: float) -> Callable[[int], float]:
+    """Return a raw-to-native converter specialised for the register scaling."""
+    if scale == 1 and offset == 0:
+        # Unscaled registers are already integers, so rounding is a no-op
+        return lambda raw_value: raw_value
+    if offset == 0:
+        return lambda raw_value: round(raw_value * scale, 2)
+    return lambda raw_value: round((raw_value * scale) + offset, 2)
+
+
+def _read_ranges(register_ids: Iterable[int]) -> Tuple[Tuple[int, int], ...]:
+    """Pack register ids into (start, count) spans that each fit one Modbus read.
+
+    Unmapped addresses inside a span are read and discarded, which costs far
+    less than a separate request per gap.
+    """
+    ranges = []
+    start_reg = end_reg = None
+    for register_id in sorted(register_ids):
+        if start_reg is None:
+            start_reg = end_reg = register_id
+        elif register_id - start_reg < MODBUS_MAX_READ_REGISTERS:
+            end_reg = register_id
+        else:
+            ranges.append((start_reg, end_reg - start_reg + 1))
+            start_reg = end_reg = register_id
+    if start_reg is not None:
+        ranges.append((start_reg, end_reg - start_reg + 1))
+    return tuple(ranges)
+
+
+_INPUT_READ_RANGES = _read_ranges(INPUT_REGISTER_MAP)
+_HOLDING_READ_RANGES = _read_ranges(HOLDING_REGISTER_MAP)
+
+
+# COP drops by 0.1 per degree of lift; lift is read in 0.1 C register steps
+_COP_DROP_PER_RAW_STEP = 0.1 * 0.1
+
+# (converter, description) per holding register for building the per-poll
+# holding records without re-reading each register's config dict
+_HOLDING_RECORD_FIELDS = {
+    register_id: (
+        register_converter(config.get("scale", 1), config.get("offset", 0)),
+        config.get("description", ""),
+    )
+    for register_id, config in HOLDING_REGISTER_MAP.items()
+}
+
+
+def _holding_record(
+    convert: Callable[[int], float], description: str, raw_value: Optional[int]
+) -> Dict[str, Any]:
+    """Build the record the number entities read for one holding register."""
+    record = {
+        "description": description,
+        "raw_value": raw_value,
+        "available": raw_value is not None,
+    }
+    if raw_value is None:
+        record["value"] = None
+        record["error"] = "Register not available"
+    else:
+        record["value"] = convert(raw_value)
+    return record
+
 
 class GrantAerona3Coordinator(DataUpdateCoordinator):
     """Class to manage fetching data from Grant Aerona3 Heat Pump."""
@@ -44,6 +125,14 @@ class GrantAerona3Coordinator(DataUpdateCoordinator):
             _LOGGER,
             name=f"{DOMAIN}_{self.host}",
             update_interval=timedelta(seconds=scan_interval),
+            # Give the heat pump time to commit a write before reading it back,
+            # and collapse back-to-back write refreshes into one poll
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
         
         self._client = ModbusTcpClient(
@@ -53,6 +142,30 @@ class GrantAerona3Coordinator(DataUpdateCoordinator):
             retry_on_empty=True,
             retries=3,
         )
+
+        # Built once per config entry and shared by every entity of the device
+        self.device_info = MappingProxyType({
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": "ASHP Grant Aerona3",
+            "manufacturer": MANUFACTURER,
+            "model": MODEL,
+            "sw_version": "2.0.0",
+            "configuration_url": f"http://{entry.data.get(CONF_HOST, '')}",
+        })
+
+        # Measured system flow rate (L/min), set by the flow rate number entity
+        self.flow_rate: float = DEFAULT_FLOW_RATE
+
+        # Holding register writes waiting to be flushed as one batch
+        self._pending_writes: Dict[int, int] = {}
+        self._write_task: Optional[asyncio.Task] = None
+
+        # The Modbus client holds one connection; polls and write batches each
+        # connect, talk and close under this lock so none can close another's socket
+        self._client_lock = asyncio.Lock()
+
+        # Register ranges already reported as failing, so each is logged once per outage
+        self._failed_ranges: set[Tuple[str, int, int]] = set()
         
         _LOGGER.info(
             "Initialized ASHP coordinator for %s:%s (scan interval: %s seconds)",
@@ -72,10 +185,16 @@ class GrantAerona3Coordinator(DataUpdateCoordinator):
 
     async def _fetch_data(self) -> Dict[str, Any]:
         """Fetch all data from the heat pump."""
+        async with self._client_lock:
+            return await self._async_fetch_data()
+
+    async def _async_fetch_data(self) -> Dict[str, Any]:
+        """Fetch all data from the heat pump without locking the client."""
         data = {
             "input_registers": {},
             "holding_registers": {},
             "coil_registers": {},
+            "holding_records": {},
             "last_update": self.hass.loop.time(),
         }
 
@@ -93,6 +212,9 @@ class GrantAerona3Coordinator(DataUpdateCoordinator):
             holding_data = await self._read_holding_registers()
             data["holding_registers"] = holding_data
 
+            # Per-register records, keyed by register id, for the number entities
+            data["holding_records"] = self._build_holding_records(holding_data)
+
             # Add some calculated values
             data["calculated"] = self._calculate_derived_values(input_data, holding_data)
 
@@ -119,110 +241,124 @@ class GrantAerona3Coordinator(DataUpdateCoordinator):
 
     async def _read_input_registers(self) -> Dict[int, float]:
         """Read all input registers."""
-        input_data = {}
-        
-        # Read registers in chunks to avoid timeouts
-        chunk_size = 20
-        register_ids = list(INPUT_REGISTER_MAP.keys())
-        
-        for i in range(0, len(register_ids), chunk_size):
-            chunk = register_ids[i:i + chunk_size]
-            if not chunk:
-                continue
-                
-            start_reg = min(chunk)
-            end_reg = max(chunk)
-            count = end_reg - start_reg + 1
-            
-            try:
-                result = await self.hass.async_add_executor_job(
-                    self._client.read_input_registers,
-                    start_reg,
-                    count,
-                    self.slave_id
-                )
-                
-                if not result.isError():
-                    for j, reg_id in enumerate(range(start_reg, end_reg + 1)):
-                        if reg_id in INPUT_REGISTER_MAP and j < len(result.registers):
-                            input_data[reg_id] = result.registers[j]
-                else:
-                    _LOGGER.warning("Error reading input registers %d-%d: %s", start_reg, end_reg, result)
-                    
-            except Exception as err:
-                _LOGGER.warning("Failed to read input registers %d-%d: %s", start_reg, end_reg, err)
-                
-        return input_data
+        return await self._read_register_ranges(
+            "input", self._client.read_input_registers, _INPUT_READ_RANGES, INPUT_REGISTER_MAP
+        )
 
     async def _read_holding_registers(self) -> Dict[int, float]:
         """Read all holding registers."""
-        holding_data = {}
-        
-        # Read registers in chunks
-        chunk_size = 20
-        register_ids = list(HOLDING_REGISTER_MAP.keys())
+        return await self._read_register_ranges(
+            "holding", self._client.read_holding_registers, _HOLDING_READ_RANGES, HOLDING_REGISTER_MAP
+        )
+
+    async def _read_register_ranges(
+        self,
+        kind: str,
+        read: Callable[..., Any],
+        ranges: Tuple[Tuple[int, int], ...],
+        register_map: Dict[int, Dict[str, Any]],
+    ) -> Dict[int, float]:
+        """Read registers with one Modbus request per precomputed range."""
+        register_data = {}
         
-        for i in range(0, len(register_ids), chunk_size):
-            chunk = register_ids[i:i + chunk_size]
-            if not chunk:
-                continue
-                
-            start_reg = min(chunk)
-            end_reg = max(chunk)
-            count = end_reg - start_reg + 1
+        for start_reg, count in ranges:
+            end_reg = start_reg + count - 1
             
             try:
                 result = await self.hass.async_add_executor_job(
-                    self._client.read_holding_registers,
+                    read,
                     start_reg,
                     count,
                     self.slave_id
                 )
                 
                 if not result.isError():
-                    for j, reg_id in enumerate(range(start_reg, end_reg + 1)):
-                        if reg_id in HOLDING_REGISTER_MAP and j < len(result.registers):
-                            holding_data[reg_id] = result.registers[j]
+                    for reg_id, value in zip(range(start_reg, end_reg + 1), result.registers):
+                        if reg_id in register_map:
+                            register_data[reg_id] = value
+                    self._clear_read_failure(kind, start_reg, end_reg)
                 else:
-                    _LOGGER.warning("Error reading holding registers %d-%d: %s", start_reg, end_reg, result)
+                    self._report_read_failure(kind, start_reg, end_reg, result)
                     
             except Exception as err:
-                _LOGGER.warning("Failed to read holding registers %d-%d: %s", start_reg, end_reg, err)
+                self._report_read_failure(kind, start_reg, end_reg, err)
                 
-        return holding_data
+        return register_data
+
+    def _report_read_failure(self, kind: str, start_reg: int, end_reg: int, err: Any) -> None:
+        """Log a failed range read once, then only at debug level until it recovers."""
+        key = (kind, start_reg, end_reg)
+        if key in self._failed_ranges:
+            _LOGGER.debug("Still failing to read %s registers %d-%d: %s", kind, start_reg, end_reg, err)
+            return
+        self._failed_ranges.add(key)
+        _LOGGER.warning("Failed to read %s registers %d-%d: %s", kind, start_reg, end_reg, err)
+
+    def _clear_read_failure(self, kind: str, start_reg: int, end_reg: int) -> None:
+        """Forget a previously failing range once it reads cleanly again."""
+        key = (kind, start_reg, end_reg)
+        if key in self._failed_ranges:
+            self._failed_ranges.discard(key)
+            _LOGGER.info("Reading %s registers %d-%d recovered", kind, start_reg, end_reg)
+
+    def _build_holding_records(self, holding_data: Dict[int, int]) -> Dict[int, Dict[str, Any]]:
+        """Normalise holding registers once per poll so entities can trust the fields."""
+        return {
+            register_id: _holding_record(convert, description, holding_data.get(register_id))
+            for register_id, (convert, description) in _HOLDING_RECORD_FIELDS.items()
+        }
+
+    @callback
+    def async_set_holding_value(self, register: int, raw_value: int) -> None:
+        """Show a written holding register value before the next poll reads it back."""
+        data = self.data
+        if not data:
+            return
+
+        data["holding_registers"][register] = raw_value
+        fields = _HOLDING_RECORD_FIELDS.get(register)
+        if fields is not None:
+            data["holding_records"][register] = _holding_record(*fields, raw_value)
+
+        # Every entity for the register updates together
+        self.async_update_listeners()
 
     def _calculate_derived_values(self, input_data: Dict[int, float], holding_data: Dict[int, float]) -> Dict[str, Any]:
         """Calculate derived values from raw register data."""
         calculated = {}
         try:
-            flow_temp = input_data.get(1)
-            return_temp = input_data.get(0)
-            outdoor_temp = input_data.get(2)
-            if flow_temp is not None:
-                flow_temp = flow_temp * 0.1
-            if return_temp is not None:
-                return_temp = return_temp * 0.1
-            if outdoor_temp is not None:
-                outdoor_temp = outdoor_temp * 0.1
+            # Temperatures arrive in 0.1 C steps. The COP estimate works on the
+            # raw lift, with the scaling folded into one constant.
+            raw_flow = input_data.get(1)
+            raw_return = input_data.get(0)
+            raw_outdoor = input_data.get(2)
+            outdoor_temp = raw_outdoor * 0.1 if raw_outdoor is not None else None
 
             if (
-                flow_temp is not None
-                and return_temp is not None
-                and outdoor_temp is not None
+                raw_flow is not None
+                and raw_return is not None
+                and raw_outdoor is not None
             ):
-                temp_lift = flow_temp - outdoor_temp
-                if temp_lift > 0:
-                    cop = max(6.8 - (temp_lift * 0.1), 1.0)
+                raw_lift = raw_flow - raw_outdoor
+                if raw_lift > 0:
+                    cop = max(6.8 - (raw_lift * _COP_DROP_PER_RAW_STEP), 1.0)
                     calculated["cop"] = round(cop, 2)
-            # Calculate estimated power if frequency is available
+            # Measured power in watts from register 3 (100 W steps)
+            raw_power = input_data.get(3)
+            if raw_power is not None and raw_power >= 0:
+                calculated["current_power"] = round(raw_power * 100, 1)
+
+            # Estimated power and efficiency both scale with compressor frequency
             frequency = input_data.get(1, 0)
             if frequency > 0:
-                estimated_power = (frequency / 100) * 3000  # Basic estimation
+                estimated_power = frequency * 30  # Basic estimation: 3000 W per 100 Hz
                 calculated["estimated_power"] = min(estimated_power, 8000)
+                # Basic efficiency calculation - adjust as needed
+                calculated["efficiency"] = round(min((frequency / 100) * 85, 95), 1)
             
             # Calculate daily energy estimate (very basic)
             if "estimated_power" in calculated:
-                daily_energy = (calculated["estimated_power"] / 1000) * 24
+                daily_energy = calculated["estimated_power"] * 0.024  # W to kWh over 24 h
                 calculated["daily_energy"] = round(daily_energy, 2)
                 
                 # Calculate daily cost estimate
@@ -248,35 +384,122 @@ class GrantAerona3Coordinator(DataUpdateCoordinator):
         return calculated
 
     async def async_write_register(self, register: int, value: int) -> bool:
-        """Write a value to a holding register."""
+        """Write a value to a holding register.
+
+        Goes through the write queue, so writes to the same register are
+        applied in the order they were made whichever entity issues them.
+        """
+        return await self.async_queue_write(register, value)
+
+    async def async_queue_write(self, register: int, value: int) -> bool:
+        """Queue a holding register write and wait for the batch to be flushed.
+
+        Writes queued within WRITE_BATCH_DELAY of each other share one
+        connection, and runs of adjacent registers go out as a single
+        Write Multiple Registers (FC16) request. A run the device rejects is
+        retried register by register, so each caller gets its own result.
+        """
+        self._pending_writes[register] = value
+        if self._write_task is None:
+            self._write_task = self.hass.async_create_task(self._async_flush_writes())
+        results = await asyncio.shield(self._write_task)
+        return results.get(register, False)
+
+    async def _async_flush_writes(self) -> Dict[int, bool]:
+        """Write all queued holding registers, grouping adjacent addresses."""
+        try:
+            await asyncio.sleep(WRITE_BATCH_DELAY)
+        finally:
+            # Later writes start a new batch; its flush waits on the client lock
+            # until this one has closed the connection. Reset even when cancelled
+            # so the queue never waits on a dead task or keeps unwritten values.
+            pending, self._pending_writes = self._pending_writes, {}
+            self._write_task = None
+
+        async with self._client_lock:
+            results = await self._async_write_batch(pending)
+
+        if any(results.values()):
+            # Trigger a data refresh
+            await self.async_request_refresh()
+
+        return results
+
+    async def _async_write_batch(self, pending: Dict[int, int]) -> Dict[int, bool]:
+        """Write one batch of holding registers without locking the client."""
+        results = {register: False for register in pending}
         try:
             connected = await self.hass.async_add_executor_job(self._client.connect)
             if not connected:
-                _LOGGER.error("Failed to connect for writing register %d", register)
-                return False
+                _LOGGER.error("Failed to connect for writing registers %s", sorted(pending))
+                return results
+
+            for start_reg, values in self._group_adjacent_writes(pending):
+                end_reg = start_reg + len(values) - 1
+                if len(values) > 1:
+                    try:
+                        result = await self.hass.async_add_executor_job(
+                            self._client.write_registers,
+                            start_reg,
+                            values,
+                            self.slave_id
+                        )
+                    except Exception as err:
+                        result = err
+                    else:
+                        if not result.isError():
+                            _LOGGER.info("Successfully wrote values %s to registers starting at %d", values, start_reg)
+                            for register in range(start_reg, end_reg + 1):
+                                results[register] = True
+                            continue
+
+                    # The run may mix writes from unrelated entities; one rejected
+                    # value must not fail the others, so retry them one by one
+                    _LOGGER.warning(
+                        "Writing registers %d-%d together failed (%s), retrying individually",
+                        start_reg, end_reg, result
+                    )
+
+                for register, value in zip(range(start_reg, end_reg + 1), values):
+                    results[register] = await self._async_write_single(register, value)
 
+        except Exception as err:
+            _LOGGER.error("Failed to write registers %s: %s", sorted(pending), err)
+        finally:
+            try:
+                await self.hass.async_add_executor_job(self._client.close)
+            except Exception:
+                pass
+
+        return results
+
+    async def _async_write_single(self, register: int, value: int) -> bool:
+        """Write one holding register (FC06) on the already open connection."""
+        try:
             result = await self.hass.async_add_executor_job(
                 self._client.write_register,
                 register,
                 value,
                 self.slave_id
             )
-            
-            if result.isError():
-                _LOGGER.error("Error writing register %d: %s", register, result)
-                return False
-            
-            _LOGGER.info("Successfully wrote value %d to register %d", value, register)
-            
-            # Trigger a data refresh
-            await self.async_request_refresh()
-            return True
-            
         except Exception as err:
             _LOGGER.error("Failed to write register %d: %s", register, err)
             return False
-        finally:
-            try:
-                await self.hass.async_add_executor_job(self._client.close)
-            except Exception:
-                pass
\ No newline at end of file
+
+        if result.isError():
+            _LOGGER.error("Error writing register %d: %s", register, result)
+            return False
+
+        _LOGGER.info("Successfully wrote value %d to register %d", value, register)
+        return True
+
+    @staticmethod
+    def _group_adjacent_writes(pending: Dict[int, int]) -> List[Tuple[int, List[int]]]:
+        """Split queued writes into runs of consecutive register addresses."""
+        groups: List[Tuple[int, List[int]]] = []
+        for register in sorted(pending):
+            if groups and groups[-1][0] + len(groups[-1][1]) == register:
+                groups[-1][1].append(pending[register])
+            else:
+                groups.append((register, [pending[register]]))
+        return groups
@@ -2,21 +2,30 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN, MANUFACTURER, MODEL, HOLDING_REGISTER_MAP
+from .const import DOMAIN, HOLDING_REGISTER_MAP
 from .coordinator import GrantAerona3Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Tooltips by holding register tag; the first matching tag wins
+_TAG_TOOLTIPS = (
+    ("dhw", "DHW (Domestic Hot Water) temperature setting"),
+    ("weather compensation", "Weather compensation automatically adjusts heating based on outdoor temperature"),
+    ("hysteresis", "Hysteresis prevents frequent switching by creating a temperature band"),
+    ("frost protection", "Frost protection prevents system damage in cold weather"),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -26,19 +35,23 @@ async def async_setup_entry(
     """Set up Grant Aerona3 number entities."""
     coordinator: GrantAerona3Coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities = []
-
-    # CRITICAL FIX: Create number entities for ALL writable holding registers
-    for register_id, config in HOLDING_REGISTER_MAP.items():
-        if config.get("writable", False):
-            entities.append(
-                GrantAerona3HoldingNumber(coordinator, config_entry, register_id)
-            )
-
-    # Add flow rate configuration entity
-    entities.append(
-        GrantAerona3FlowRateNumber(coordinator, config_entry)
-    )
+    # CRITICAL FIX: Create number entities for ALL writable holding registers,
+    # plus the flow rate configuration entity
+    entities = [
+        GrantAerona3HoldingNumber(coordinator, config_entry, register_id, config)
+        for register_id, config in HOLDING_REGISTER_MAP.items()
+        if config.get("writable", False)
+    ]
+    entities.append(GrantAerona3FlowRateNumber(coordinator, config_entry))
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        skipped = [
+            register_id
+            for register_id, config in HOLDING_REGISTER_MAP.items()
+            if not config.get("writable", False)
+        ]
+        if skipped:
+            _LOGGER.debug("Skipped read-only holding registers: %s", skipped)
 
     _LOGGER.info("Creating %d number entities", len(entities))
     async_add_entities(entities)
@@ -52,36 +65,35 @@ class GrantAerona3HoldingNumber(CoordinatorEntity, NumberEntity):
         coordinator: GrantAerona3Coordinator,
         config_entry: ConfigEntry,
         register_id: int,
+        register_config: Dict[str, Any],
     ) -> None:
         """Initialize the number entity."""
         super().__init__(coordinator)
         self._register_id = register_id
-        self._register_config = HOLDING_REGISTER_MAP[register_id]
+        self._register_config = register_config
+        self._scale = self._register_config["scale"]
 
         self._attr_unique_id = f"{config_entry.entry_id}_number_holding_{register_id}"
         self._attr_name = f"{self._register_config['name']}"
 
-        # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "ASHP",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "1.0.0",
-        }
+        # Shared device info, built once per config entry by the coordinator
+        self._attr_device_info = coordinator.device_info
 
         # Set number properties
         self._attr_native_unit_of_measurement = self._register_config["unit"]
         self._attr_mode = NumberMode.BOX  # Use box mode for precise control
 
+        # Name-derived tags are resolved once in const.py
+        tags = self._register_config["tags"]
+
         # Set min/max values based on register type and unit
         if self._register_config["unit"] == UnitOfTemperature.CELSIUS:
             # Temperature ranges
-            if "dhw" in self._register_config["name"].lower():
+            if "dhw" in tags:
                 self._attr_native_min_value = 10.0
                 self._attr_native_max_value = 70.0
                 self._attr_native_step = 0.5
-            elif "outdoor" in self._register_config["name"].lower():
+            elif "outdoor" in tags:
                 self._attr_native_min_value = -30.0
                 self._attr_native_max_value = 50.0
                 self._attr_native_step = 0.5
@@ -91,12 +103,11 @@ class GrantAerona3HoldingNumber(CoordinatorEntity, NumberEntity):
                 self._attr_native_step = 0.5
         elif self._register_config["unit"] is None:
             # Non-unit values (modes, settings, etc.)
-            name_lower = self._register_config["name"].lower()
-            if "mode" in name_lower or "type" in name_lower or "function" in name_lower:
+            if tags & {"mode", "type", "function"}:
                 self._attr_native_min_value = 0
                 self._attr_native_max_value = 10  # Most modes are 0-3, give some room
                 self._attr_native_step = 1
-            elif "time" in name_lower or "delay" in name_lower:
+            elif "time" in tags or "delay" in tags:
                 self._attr_native_min_value = 0
                 self._attr_native_max_value = 300  # Up to 5 minutes for timing settings
                 self._attr_native_step = 1
@@ -111,16 +122,15 @@ class GrantAerona3HoldingNumber(CoordinatorEntity, NumberEntity):
             self._attr_native_step = 1
 
         # Set icon based on function
-        name_lower = self._register_config["name"].lower()
-        if "temp" in name_lower:
+        if "temp" in tags:
             self._attr_icon = "mdi:thermometer"
-        elif "dhw" in name_lower:
+        elif "dhw" in tags:
             self._attr_icon = "mdi:water-thermometer"
-        elif "time" in name_lower or "delay" in name_lower:
+        elif "time" in tags or "delay" in tags:
             self._attr_icon = "mdi:clock"
-        elif "hysteresis" in name_lower:
+        elif "hysteresis" in tags:
             self._attr_icon = "mdi:thermometer-lines"
-        elif "flow" in name_lower:
+        elif "flow" in tags:
             self._attr_icon = "mdi:pipe"
         else:
             self._attr_icon = "mdi:tune"
@@ -128,79 +138,87 @@ class GrantAerona3HoldingNumber(CoordinatorEntity, NumberEntity):
         # Set entity category
         self._attr_entity_category = EntityCategory.CONFIG
 
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the current value."""
-        register_key = f"holding_{self._register_id}"
-        if register_key not in self.coordinator.data:
-            return None
-
-        register_data = self.coordinator.data[register_key]
-        
-        # Check if register is available
-        if not register_data.get("available", True):
-            return None
-            
-        return register_data["value"]
+        # Static attribute skeleton; only the live register fields are overlaid per call
+        self._attributes_template: Dict[str, Any] = {
+            "register_address": register_id,
+            "scale_factor": self._scale,
+        }
+        tooltip = next((text for tag, text in _TAG_TOOLTIPS if tag in tags), None)
+        if tooltip is not None:
+            self._attributes_template["tooltip"] = tooltip
+        self._not_configured_attributes = MappingProxyType(
+            {"register_address": register_id, "status": "not_configured"}
+        )
+        self._unavailable_attributes = MappingProxyType(
+            {"register_address": register_id, "status": "unavailable"}
+        )
+        self._update_from_record()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
         # Convert value back to raw register value using the scale factor from const.py
-        raw_value = int(value / self._register_config["scale"])
+        raw_value = int(value / self._scale)
 
-        success = await self.coordinator.async_write_holding_register(self._register_id, raw_value)
+        # Queued so settings changed together go out in one Modbus transaction;
+        # the coordinator schedules a debounced refresh after a successful write
+        success = await self.coordinator.async_queue_write(self._register_id, raw_value)
         if success:
-            # Request immediate refresh to update state
-            await self.coordinator.async_request_refresh()
+            # Updates the holding record too, so every entity for the register
+            # shows the new value before the refresh reads it back
+            self.coordinator.async_set_holding_value(self._register_id, raw_value)
         else:
             _LOGGER.error("Failed to set value %s for %s", value, self._attr_name)
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional state attributes."""
-        register_key = f"holding_{self._register_id}"
-        if register_key not in self.coordinator.data:
-            return {"register_address": self._register_id, "status": "not_configured"}
-
-        data = self.coordinator.data[register_key]
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Resolve the state once per poll instead of on every state read."""
+        self._update_from_record()
+        super()._handle_coordinator_update()
 
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # CoordinatorEntity.available ignores _attr_available, so combine both
+        return super().available and self._attr_available
+
+    def _update_from_record(self) -> None:
+        """Set value, availability and attributes from a single record lookup."""
+        # Cheapest check first; during outages this is the common path.
+        # CoordinatorEntity already reports the entity unavailable here.
+        if not self.coordinator.last_update_success:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = self._unavailable_attributes
+            return
+
+        record = self.coordinator.data["holding_records"].get(self._register_id)
+
+        # Entity is available even if register is not readable (shows unavailable
+        # state), but not when the register has no record at all
+        self._attr_available = record is not None
+        if record is None:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = self._not_configured_attributes
+            return
+
+        # The coordinator always fills "value"; it is None when the read failed
+        self._attr_native_value = record["value"]
+
+        available = record["available"]
         attributes = {
-            "register_address": self._register_id,
-            "description": data.get("description", ""),
-            "scale_factor": self._register_config["scale"],
-            "raw_value": data.get("raw_value"),
-            "available": data.get("available", True),
+            **self._attributes_template,
+            "description": record["description"],
+            "raw_value": record["raw_value"],
+            "available": available,
         }
 
         # Add error information if register is not available
-        if not data.get("available", True):
-            attributes["error"] = data.get("error", "Register not available")
+        if not available:
+            attributes["error"] = record["error"]
             attributes["status"] = "unavailable"
         else:
             attributes["status"] = "available"
 
-        # Add helpful information for specific setting types
-        name_lower = self._register_config["name"].lower()
-        if "dhw" in name_lower:
-            attributes["tooltip"] = "DHW (Domestic Hot Water) temperature setting"
-        elif "weather compensation" in name_lower:
-            attributes["tooltip"] = "Weather compensation automatically adjusts heating based on outdoor temperature"
-        elif "hysteresis" in name_lower:
-            attributes["tooltip"] = "Hysteresis prevents frequent switching by creating a temperature band"
-        elif "frost protection" in name_lower:
-            attributes["tooltip"] = "Frost protection prevents system damage in cold weather"
-
-        return attributes
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        register_key = f"holding_{self._register_id}"
-        if register_key not in self.coordinator.data:
-            return False
-            
-        # Entity is available even if register is not readable (shows unavailable state)
-        return self.coordinator.last_update_success
+        self._attr_extra_state_attributes = attributes
 
 
 class GrantAerona3FlowRateNumber(CoordinatorEntity, NumberEntity):
@@ -224,37 +242,26 @@ class GrantAerona3FlowRateNumber(CoordinatorEntity, NumberEntity):
         self._attr_icon = "mdi:water-pump"
         self._attr_entity_category = EntityCategory.CONFIG
 
-        # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, config_entry.entry_id)},
-            "name": "ASHP",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "1.1.0",
-        }
+        # Shared device info, built once per config entry by the coordinator
+        self._attr_device_info = coordinator.device_info
 
-        # Default flow rate - typical for residential Grant Aerona3
-        self._flow_rate = 30.0
+        # Starts from the coordinator's flow rate, which defaults to a
+        # typical residential Grant Aerona3 value
+        self._attr_native_value = coordinator.flow_rate
 
-    @property
-    def native_value(self) -> float:
-        """Return the current flow rate."""
-        return self._flow_rate
+        # These never change, so they are set once rather than rebuilt per state write
+        self._attr_extra_state_attributes = MappingProxyType({
+            "description": "Manually measured flow rate for COP calculations",
+            "how_to_measure": "Use a flow meter or calculate from pump curves",
+            "typical_range": "15-25 L/min for residential systems",
+            "tooltip": "Set this to your actual measured flow rate for accurate COP calculations"
+        })
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the flow rate value."""
-        self._flow_rate = value
+        self._attr_native_value = value
         _LOGGER.info("Flow rate set to %.1f L/min", value)
 
         # Store in coordinator for COP calculations
         self.coordinator.flow_rate = value
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional state attributes."""
-        return {
-            "description": "Manually measured flow rate for COP calculations",
-            "how_to_measure": "Use a flow meter or calculate from pump curves",
-            "typical_range": "15-25 L/min for residential systems",
-            "tooltip": "Set this to your actual measured flow rate for accurate COP calculations"
-        }
\ No newline at end of file
+        self.async_write_ha_state()
\ No newline at end of file
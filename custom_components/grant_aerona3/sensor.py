@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -17,16 +19,64 @@ from homeassistant.const import (
     UnitOfTime,
     PERCENTAGE,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
-from .const import DOMAIN, MANUFACTURER, MODEL, INPUT_REGISTER_MAP, HOLDING_REGISTER_MAP
-from .coordinator import GrantAerona3Coordinator
+from .const import DOMAIN, INPUT_REGISTER_MAP, HOLDING_REGISTER_MAP
+from .coordinator import EMPTY_ATTRIBUTES, EMPTY_REGISTERS, GrantAerona3Coordinator, register_converter
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maps register names onto entity_id-safe characters in a single pass
+_CLEAN_NAME_TABLE = str.maketrans({" ": "_", "-": "_", "/": "_", "(": None, ")": None})
+
+# (id, config) pairs in register order, resolved once for entity setup
+_INPUT_REGISTER_ITEMS = tuple(sorted(INPUT_REGISTER_MAP.items()))
+_HOLDING_REGISTER_ITEMS = tuple(sorted(HOLDING_REGISTER_MAP.items()))
+
+# Input sensor icons, by device class first and then by name keyword
+_INPUT_DEVICE_CLASS_ICONS = {
+    SensorDeviceClass.TEMPERATURE: "mdi:thermometer",
+    SensorDeviceClass.POWER: "mdi:flash",
+}
+_INPUT_NAME_ICONS = (
+    ("frequency", "mdi:gauge"),
+    ("pressure", "mdi:gauge-low"),
+)
+
+
+def _input_icon(register_config: Dict[str, Any]) -> str:
+    """Pick an input register sensor's icon from its config."""
+    name_lower = register_config.get("name", "").lower()
+    return _INPUT_DEVICE_CLASS_ICONS.get(register_config.get("device_class")) or next(
+        (icon for keyword, icon in _INPUT_NAME_ICONS if keyword in name_lower),
+        "mdi:heat-pump",
+    )
+
+
+# Resolved at import so reloading the entry does not rescan the names
+_INPUT_REGISTER_ICONS = {
+    register_id: _input_icon(register_config)
+    for register_id, register_config in _INPUT_REGISTER_ITEMS
+}
+
+# Fixed attributes of the calculated sensors, shared rather than rebuilt per update
+_ENERGY_ATTRIBUTES = MappingProxyType({
+    "calculation_method": "direct_register",
+    "note": "Use utility_meter integration with power sensor for accurate daily tracking",
+})
+_DAILY_COST_ATTRIBUTES = MappingProxyType({
+    "electricity_rate": "0.30 GBP/kWh",
+    "note": "Estimated cost - set up utility_meter for accurate tracking",
+})
+_MONTHLY_COST_ATTRIBUTES = MappingProxyType({
+    "electricity_rate": "0.30 GBP/kWh",
+    "projection_method": "current_power_x30_days",
+    "note": "Projection based on current consumption - actual costs may vary",
+})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -36,30 +86,15 @@ async def async_setup_entry(
     """Set up Grant Aerona3 sensor entities with ashp_ prefixes."""
     coordinator: GrantAerona3Coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities = []
-
-    # Create sensors for ALL input registers with ashp_ prefix
-    for register_id in INPUT_REGISTER_MAP.keys():
-        entities.append(
-            GrantAerona3InputSensor(coordinator, config_entry, register_id)
-        )
-
-    # Create sensors for ALL holding registers with ashp_ prefix
-    for register_id in HOLDING_REGISTER_MAP.keys():
-        entities.append(
-            GrantAerona3HoldingSensor(coordinator, config_entry, register_id)
-        )
-
-    # Add calculated sensors with ashp_ prefix
-    entities.extend([
-        GrantAerona3PowerSensor(coordinator, config_entry),
-        GrantAerona3EnergySensor(coordinator, config_entry),
-        GrantAerona3COPSensor(coordinator, config_entry),
-        GrantAerona3EfficiencySensor(coordinator, config_entry),
-        GrantAerona3WeatherCompSensor(coordinator, config_entry),
-        GrantAerona3DailyCostSensor(coordinator, config_entry),
-        GrantAerona3MonthlyCostSensor(coordinator, config_entry),
-    ])
+    # Sensors for ALL input and holding registers, plus the calculated sensors
+    entities = [
+        *(GrantAerona3InputSensor(coordinator, config_entry, register_id, register_config)
+          for register_id, register_config in _INPUT_REGISTER_ITEMS),
+        *(GrantAerona3HoldingSensor(coordinator, config_entry, register_id, register_config)
+          for register_id, register_config in _HOLDING_REGISTER_ITEMS),
+        *(sensor_class(coordinator, config_entry)
+          for sensor_class in _CALCULATED_SENSOR_CLASSES),
+    ]
 
     _LOGGER.info("Creating %d ASHP sensor entities with ashp_ prefix", len(entities))
     async_add_entities(entities)
@@ -76,18 +111,65 @@ class GrantAerona3BaseSensor(CoordinatorEntity, SensorEntity):
         """Initialize the base sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
+        self._attr_device_info = coordinator.device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state when the entity is added."""
+        await super().async_added_to_hass()
+        self._update_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Compute the state once per poll instead of on every state read."""
+        self._update_state()
+        super()._handle_coordinator_update()
+
+    def _update_state(self) -> None:
+        """Store the value and attributes for the latest coordinator data."""
+        self._attr_native_value = self._compute_native_value()
+        self._attr_extra_state_attributes = self._build_extra_state_attributes()
+
+    def _compute_native_value(self) -> Optional[float]:
+        """Return the sensor value for the latest coordinator data."""
+        return None
 
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._config_entry.entry_id)},
-            "name": "ASHP Grant Aerona3",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": "2.0.0",
-            "configuration_url": f"http://{self._config_entry.data.get('host', '')}",
-        }
+    def _build_extra_state_attributes(self) -> Optional[Mapping[str, Any]]:
+        """Return the state attributes for the latest coordinator data."""
+        return None
+
+    def _input(self, register_id: int, default: Any = None) -> Any:
+        """Return a raw input register value from the latest coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            return default
+        return data["input_registers"].get(register_id, default)
+
+    def _holding(self, register_id: int, default: Any = None) -> Any:
+        """Return a raw holding register value from the latest coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            return default
+        return data["holding_registers"].get(register_id, default)
+
+
+class GrantAerona3CalculatedSensor(GrantAerona3BaseSensor):
+    """Base class for sensors derived from register values.
+
+    Subclasses declare their static entity settings as class attributes and
+    ``_key``, from which the unique_id and entity_id are built.
+    """
+
+    _key: str
+
+    def __init__(
+        self,
+        coordinator: GrantAerona3Coordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the calculated sensor with ashp_ prefix."""
+        super().__init__(coordinator, config_entry)
+        self._attr_unique_id = sys.intern(f"ashp_{config_entry.entry_id}_{self._key}")
+        self.entity_id = sys.intern(f"sensor.ashp_{self._key}")
 
 
 class GrantAerona3InputSensor(GrantAerona3BaseSensor):
@@ -98,76 +180,51 @@ class GrantAerona3InputSensor(GrantAerona3BaseSensor):
         coordinator: GrantAerona3Coordinator,
         config_entry: ConfigEntry,
         register_id: int,
+        register_config: Dict[str, Any],
     ) -> None:
         """Initialize the sensor with ashp_ prefix."""
         super().__init__(coordinator, config_entry)
         self._register_id = register_id
-        self._register_config = INPUT_REGISTER_MAP.get(register_id, {})
+        self._register_config = register_config
         
         # Create entity_id and names with ashp_ prefix
         register_name = self._register_config.get("name", f"Input Register {register_id}")
-        clean_name = register_name.lower().replace(' ', '_').replace('-', '_').replace('(', '').replace(')', '').replace('/', '_')
+        clean_name = register_name.lower().translate(_CLEAN_NAME_TABLE)
         
         self._attr_name = f"ASHP {register_name}"
-        self._attr_unique_id = f"ashp_{config_entry.entry_id}_input_{register_id}"
-        self.entity_id = f"sensor.ashp_{clean_name}"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        
-        raw_value = self.coordinator.data.get("input_registers", {}).get(self._register_id)
-        if raw_value is None:
-            return None
-        
-        scale = self._register_config.get("scale", 1)
-        offset = self._register_config.get("offset", 0)
-        
-        return round((raw_value * scale) + offset, 2)
-
-    @property
-    def native_unit_of_measurement(self) -> Optional[str]:
-        """Return the unit of measurement."""
-        return self._register_config.get("unit")
-
-    @property
-    def device_class(self) -> Optional[SensorDeviceClass]:
-        """Return the device class."""
-        return self._register_config.get("device_class")
-
-    @property
-    def state_class(self) -> Optional[SensorStateClass]:
-        """Return the state class."""
-        return self._register_config.get("state_class")
-
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        device_class = self._register_config.get("device_class")
-        if device_class == SensorDeviceClass.TEMPERATURE:
-            return "mdi:thermometer"
-        elif device_class == SensorDeviceClass.POWER:
-            return "mdi:flash"
-        elif "frequency" in self._register_config.get("name", "").lower():
-            return "mdi:gauge"
-        elif "pressure" in self._register_config.get("name", "").lower():
-            return "mdi:gauge-low"
-        else:
-            return "mdi:heat-pump"
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "register_id": self._register_id,
+        self._attr_unique_id = sys.intern(f"ashp_{config_entry.entry_id}_input_{register_id}")
+        self.entity_id = sys.intern(f"sensor.ashp_{clean_name}")
+
+        # Resolve the static register settings once instead of on every state read
+        self._scale = self._register_config.get("scale", 1)
+        self._offset = self._register_config.get("offset", 0)
+        self._convert = register_converter(self._scale, self._offset)
+        self._attr_native_unit_of_measurement = self._register_config.get("unit")
+        self._attr_device_class = self._register_config.get("device_class")
+        self._attr_state_class = self._register_config.get("state_class")
+
+        self._attr_icon = _INPUT_REGISTER_ICONS[register_id]
+
+        # Static attributes; only raw_value is added per read
+        self._attributes_template: Dict[str, Any] = {
+            "register_id": register_id,
             "register_type": "input",
             "description": self._register_config.get("description", ""),
-            "raw_value": self.coordinator.data.get("input_registers", {}).get(self._register_id) if self.coordinator.data else None,
-            "scale_factor": self._register_config.get("scale", 1),
-            "offset": self._register_config.get("offset", 0),
+            "scale_factor": self._scale,
+            "offset": self._offset,
         }
+        self._attributes: Optional[Dict[str, Any]] = None
+
+    def _update_state(self) -> None:
+        """Store the value and attributes from a single register read."""
+        raw_value = self._input(self._register_id)
+        self._attr_native_value = None if raw_value is None else self._convert(raw_value)
+
+        # Most registers hold steady between polls; keep the previous dict then
+        attributes = self._attributes
+        if attributes is None or attributes["raw_value"] != raw_value:
+            attributes = self._attributes = {**self._attributes_template, "raw_value": raw_value}
+        self._attr_extra_state_attributes = attributes
 
 
 class GrantAerona3HoldingSensor(GrantAerona3BaseSensor):
@@ -178,158 +235,114 @@ class GrantAerona3HoldingSensor(GrantAerona3BaseSensor):
         coordinator: GrantAerona3Coordinator,
         config_entry: ConfigEntry,
         register_id: int,
+        register_config: Dict[str, Any],
     ) -> None:
         """Initialize the sensor with ashp_ prefix."""
         super().__init__(coordinator, config_entry)
         self._register_id = register_id
-        self._register_config = HOLDING_REGISTER_MAP.get(register_id, {})
+        self._register_config = register_config
         
         # Create entity_id and names with ashp_ prefix
         register_name = self._register_config.get("name", f"Holding Register {register_id}")
-        clean_name = register_name.lower().replace(' ', '_').replace('-', '_').replace('(', '').replace(')', '').replace('/', '_')
+        clean_name = register_name.lower().translate(_CLEAN_NAME_TABLE)
         
         self._attr_name = f"ASHP {register_name}"
-        self._attr_unique_id = f"ashp_{config_entry.entry_id}_holding_{register_id}"
-        self.entity_id = f"sensor.ashp_{clean_name}"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        
-        raw_value = self.coordinator.data.get("holding_registers", {}).get(self._register_id)
-        if raw_value is None:
-            return None
-        
-        scale = self._register_config.get("scale", 1)
-        offset = self._register_config.get("offset", 0)
-        
-        return round((raw_value * scale) + offset, 2)
-
-    @property
-    def native_unit_of_measurement(self) -> Optional[str]:
-        """Return the unit of measurement."""
-        return self._register_config.get("unit")
-
-    @property
-    def device_class(self) -> Optional[SensorDeviceClass]:
-        """Return the device class."""
-        return self._register_config.get("device_class")
-
-    @property
-    def state_class(self) -> Optional[SensorStateClass]:
-        """Return the state class."""
-        return self._register_config.get("state_class")
-
-    @property
-    def entity_category(self) -> Optional[EntityCategory]:
-        """Return the entity category for configuration parameters."""
-        if self._register_config.get("writable", False):
-            return EntityCategory.CONFIG
-        return None
-
-    @property
-    def icon(self) -> str:
-        """Return the icon for the sensor."""
-        if self._register_config.get("writable", False):
-            return "mdi:cog"
-        elif self._register_config.get("device_class") == SensorDeviceClass.TEMPERATURE:
-            return "mdi:thermometer-lines"
+        self._attr_unique_id = sys.intern(f"ashp_{config_entry.entry_id}_holding_{register_id}")
+        self.entity_id = sys.intern(f"sensor.ashp_{clean_name}")
+
+        # Resolve the static register settings once instead of on every state read
+        self._scale = self._register_config.get("scale", 1)
+        self._offset = self._register_config.get("offset", 0)
+        self._convert = register_converter(self._scale, self._offset)
+        self._attr_native_unit_of_measurement = self._register_config.get("unit")
+        self._attr_device_class = self._register_config.get("device_class")
+        self._attr_state_class = self._register_config.get("state_class")
+
+        # Category and icon depend only on the register config, so pick them once
+        writable = self._register_config.get("writable", False)
+        if writable:
+            self._attr_entity_category = EntityCategory.CONFIG
+            self._attr_icon = "mdi:cog"
+        elif self._attr_device_class == SensorDeviceClass.TEMPERATURE:
+            self._attr_icon = "mdi:thermometer-lines"
         else:
-            return "mdi:heat-pump-outline"
+            self._attr_icon = "mdi:heat-pump-outline"
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return extra state attributes."""
-        return {
-            "register_id": self._register_id,
+        # Static attributes; only raw_value is added per read
+        self._attributes_template: Dict[str, Any] = {
+            "register_id": register_id,
             "register_type": "holding",
-            "writable": self._register_config.get("writable", False),
+            "writable": writable,
             "description": self._register_config.get("description", ""),
-            "raw_value": self.coordinator.data.get("holding_registers", {}).get(self._register_id) if self.coordinator.data else None,
-            "scale_factor": self._register_config.get("scale", 1),
-            "offset": self._register_config.get("offset", 0),
+            "scale_factor": self._scale,
+            "offset": self._offset,
         }
+        self._attributes: Optional[Dict[str, Any]] = None
+
+    def _update_state(self) -> None:
+        """Store the value and attributes from a single register read."""
+        raw_value = self._holding(self._register_id)
+        self._attr_native_value = None if raw_value is None else self._convert(raw_value)
 
+        # Most registers hold steady between polls; keep the previous dict then
+        attributes = self._attributes
+        if attributes is None or attributes["raw_value"] != raw_value:
+            attributes = self._attributes = {**self._attributes_template, "raw_value": raw_value}
+        self._attr_extra_state_attributes = attributes
 
-class GrantAerona3PowerSensor(GrantAerona3BaseSensor):
+
+class GrantAerona3PowerSensor(GrantAerona3CalculatedSensor):
     """Grant Aerona3 calculated power sensor with ashp_ prefix."""
 
-    def __init__(
-        self,
-        coordinator: GrantAerona3Coordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the power sensor with ashp_ prefix."""
-        super().__init__(coordinator, config_entry)
-        self._attr_name = "ASHP Current Power"
-        self._attr_unique_id = f"ashp_{config_entry.entry_id}_current_power"
-        self.entity_id = "sensor.ashp_current_power"
-        self._attr_device_class = SensorDeviceClass.POWER
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = UnitOfPower.WATT
-        self._attr_icon = "mdi:flash"
-
-    @property
-    def native_value(self) -> Optional[float]:
+    _key = "current_power"
+    _attr_name = "ASHP Current Power"
+    _attr_device_class = SensorDeviceClass.POWER
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfPower.WATT
+    _attr_icon = "mdi:flash"
+
+    def _compute_native_value(self) -> Optional[float]:
         """Calculate power consumption from available registers."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         
-        # Get power from register 3: Current consumption value (100W scale)
-        input_regs = self.coordinator.data.get("input_registers", {})
-        
-        power = input_regs.get(3)  # Register 3: Current consumption value
-        if power is not None and power >= 0:
-            return round(power * 100, 1)  # Convert from 100W scale to watts
-        
-        return 0
+        # Register 3 (100W scale) is converted to watts once per poll by the coordinator
+        return data["calculated"].get("current_power", 0)
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        if not self.coordinator.data:
-            return {}
+        data = self.coordinator.data
+        if not data:
+            return EMPTY_ATTRIBUTES
         
-        input_regs = self.coordinator.data.get("input_registers", {})
+        input_registers = data["input_registers"]
         return {
             "register_source": "Register 3 - Current consumption value",
             "scale_factor": "100W",
-            "compressor_frequency": input_regs.get(1, 0),
-            "raw_power_value": input_regs.get(3, 0),
+            "compressor_frequency": input_registers.get(1, 0),
+            "raw_power_value": input_registers.get(3, 0),
         }
 
 
-class GrantAerona3EnergySensor(GrantAerona3BaseSensor):
+class GrantAerona3EnergySensor(GrantAerona3CalculatedSensor):
     """Grant Aerona3 energy consumption sensor with ashp_ prefix."""
 
-    def __init__(
-        self,
-        coordinator: GrantAerona3Coordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the energy sensor with ashp_ prefix."""
-        super().__init__(coordinator, config_entry)
-        self._attr_name = "ASHP Daily Energy"
-        self._attr_unique_id = f"ashp_{config_entry.entry_id}_daily_energy"
-        self.entity_id = "sensor.ashp_daily_energy"
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_icon = "mdi:lightning-bolt"
-
-    @property
-    def native_value(self) -> Optional[float]:
+    _key = "daily_energy"
+    _attr_name = "ASHP Daily Energy"
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_icon = "mdi:lightning-bolt"
+
+    def _compute_native_value(self) -> Optional[float]:
         """Return daily energy consumption."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         
-        # Look for energy register or calculate from power
-        input_regs = self.coordinator.data.get("input_registers", {})
-        
         # Try to get direct energy reading (adjust register as needed)
-        energy = input_regs.get(10)  # Adjust this register number
+        energy = data["input_registers"].get(10)  # Adjust this register number
         if energy is not None:
             return round(energy / 1000, 2) if energy > 0 else 0
         
@@ -337,168 +350,105 @@ class GrantAerona3EnergySensor(GrantAerona3BaseSensor):
         # This is just a placeholder
         return 0
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        return {
-            "calculation_method": "direct_register",
-            "note": "Use utility_meter integration with power sensor for accurate daily tracking"
-        }
+        return _ENERGY_ATTRIBUTES
 
 
-class GrantAerona3COPSensor(GrantAerona3BaseSensor):
+class GrantAerona3COPSensor(GrantAerona3CalculatedSensor):
     """Grant Aerona3 Coefficient of Performance sensor with ashp_ prefix."""
 
-    def __init__(
-        self,
-        coordinator: GrantAerona3Coordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the COP sensor with ashp_ prefix."""
-        super().__init__(coordinator, config_entry)
-        self._attr_name = "ASHP Coefficient of Performance"
-        self._attr_unique_id = f"ashp_{config_entry.entry_id}_coefficient_of_performance"
-        self.entity_id = "sensor.ashp_coefficient_of_performance"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = None
-        self._attr_icon = "mdi:speedometer"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Calculate COP from available data."""
-        if not self.coordinator.data:
+    _key = "coefficient_of_performance"
+    _attr_name = "ASHP Coefficient of Performance"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:speedometer"
+
+    def _compute_native_value(self) -> Optional[float]:
+        """Return the COP calculated by the coordinator."""
+        data = self.coordinator.data
+        if not data:
             return None
         
-        input_regs = self.coordinator.data.get("input_registers", {})
-        
-        # Get temperatures for COP calculation
-        flow_temp = input_regs.get(1)
-        flow_temp = flow_temp * 0.1 if flow_temp is not None else None
-        return_temp = input_regs.get(0, 0) * 0.1 if input_regs.get(0) else None  # Adjust register/scale
-        value = input_regs.get(2)
-        value = value * 0.1 if value is not None else None
-        
-        if flow_temp and return_temp and value:
-            # Simplified COP calculation based on temperatures
-            temp_lift = flow_temp - value
-            if temp_lift > 0:
-                # Basic COP estimation - adjust formula as needed
-                cop = 6.8 - (temp_lift * 0.1)
-                return round(max(cop, 1.0), 2)
-        
-        return None
+        # Estimated once per poll from the flow/outdoor temperature lift,
+        # alongside the coordinator's other derived values
+        return data["calculated"].get("cop")
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_extra_state_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        input_regs = self.coordinator.data.get("input_registers", {}) if self.coordinator.data else {}
+        data = self.coordinator.data
+        input_registers = data["input_registers"] if data else EMPTY_REGISTERS
+        flow_temp = input_registers.get(1)
+        return_temp = input_registers.get(0)
+        outdoor_temp = input_registers.get(2)
         return {
             "calculation_method": "temperature_based_estimation",
-            "flow_temperature": input_regs.get(1, 0) * 0.1 if input_regs.get(1) else None,
-            "return_temperature": input_regs.get(0, 0) * 0.1 if input_regs.get(0) else None,
-            "outdoor_temperature": input_regs.get(2, 0) * 0.1 if input_regs.get(2) else None,
+            "flow_temperature": flow_temp * 0.1 if flow_temp is not None else None,
+            "return_temperature": return_temp * 0.1 if return_temp is not None else None,
+            "outdoor_temperature": outdoor_temp * 0.1 if outdoor_temp is not None else None,
         }
 
 
-class GrantAerona3EfficiencySensor(GrantAerona3BaseSensor):
+class GrantAerona3EfficiencySensor(GrantAerona3CalculatedSensor):
     """Grant Aerona3 efficiency sensor with ashp_ prefix."""
 
-    def __init__(
-        self,
-        coordinator: GrantAerona3Coordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the efficiency sensor with ashp_ prefix."""
-        super().__init__(coordinator, config_entry)
-        self._attr_name = "ASHP System Efficiency"
-        self._attr_unique_id = f"ashp_{config_entry.entry_id}_system_efficiency"
-        self.entity_id = "sensor.ashp_system_efficiency"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_icon = "mdi:percent"
-
-    @property
-    def native_value(self) -> Optional[float]:
-        """Calculate system efficiency percentage."""
-        if not self.coordinator.data:
+    _key = "system_efficiency"
+    _attr_name = "ASHP System Efficiency"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_icon = "mdi:percent"
+
+    def _compute_native_value(self) -> Optional[float]:
+        """Return system efficiency percentage."""
+        data = self.coordinator.data
+        if not data:
             return None
-        
-        # Get COP and convert to efficiency percentage
-        input_regs = self.coordinator.data.get("input_registers", {})
-        
-        # Simple efficiency based on compressor frequency
-        frequency = input_regs.get(1, 0)
-        if frequency > 0:
-            # Basic efficiency calculation - adjust as needed
-            efficiency = min((frequency / 100) * 85, 95)  # Scale to percentage
-            return round(efficiency, 1)
-        
-        return None
 
+        # Calculated by the coordinator alongside the estimated power
+        return data["calculated"].get("efficiency")
 
-class GrantAerona3WeatherCompSensor(GrantAerona3BaseSensor):
+
+class GrantAerona3WeatherCompSensor(GrantAerona3CalculatedSensor):
     """Grant Aerona3 weather compensation sensor with ashp_ prefix."""
 
-    def __init__(
-        self,
-        coordinator: GrantAerona3Coordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the weather compensation sensor with ashp_ prefix."""
-        super().__init__(coordinator, config_entry)
-        self._attr_name = "ASHP Weather Compensation"
-        self._attr_unique_id = f"ashp_{config_entry.entry_id}_weather_compensation"
-        self.entity_id = "sensor.ashp_weather_compensation"
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        self._attr_icon = "mdi:weather-partly-cloudy"
-
-    @property
-    def native_value(self) -> Optional[float]:
+    _key = "weather_compensation"
+    _attr_name = "ASHP Weather Compensation"
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_icon = "mdi:weather-partly-cloudy"
+
+    def _compute_native_value(self) -> Optional[float]:
         """Return weather compensation target temperature."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         
-        # Get from holding register or calculate
-        holding_regs = self.coordinator.data.get("holding_registers", {})
-        
         # Try to get weather compensation setting (adjust register as needed)
-        comp_temp = holding_regs.get(50)  # Adjust register number
+        comp_temp = data["holding_registers"].get(50)  # Adjust register number
         if comp_temp is not None:
             return round(comp_temp * 0.1, 1)  # Adjust scale factor
         
         return None
 
 
-class GrantAerona3DailyCostSensor(GrantAerona3BaseSensor):
+class GrantAerona3DailyCostSensor(GrantAerona3CalculatedSensor):
     """Grant Aerona3 daily cost sensor with ashp_ prefix."""
 
-    def __init__(
-        self,
-        coordinator: GrantAerona3Coordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the daily cost sensor with ashp_ prefix."""
-        super().__init__(coordinator, config_entry)
-        self._attr_name = "ASHP Daily Cost Estimate"
-        self._attr_unique_id = f"ashp_{config_entry.entry_id}_daily_cost_estimate"
-        self.entity_id = "sensor.ashp_daily_cost_estimate"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = "GBP"
-        self._attr_icon = "mdi:currency-gbp"
-
-    @property
-    def native_value(self) -> Optional[float]:
+    _key = "daily_cost_estimate"
+    _attr_name = "ASHP Daily Cost Estimate"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "GBP"
+    _attr_icon = "mdi:currency-gbp"
+
+    def _compute_native_value(self) -> Optional[float]:
         """Calculate estimated daily cost."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         
         # Basic cost calculation - this would be enhanced with actual energy tracking
-        input_regs = self.coordinator.data.get("input_registers", {})
-        
         # Estimate from current power consumption
-        power = input_regs.get(5, 0)  # Adjust register
+        power = data["input_registers"].get(5, 0)  # Adjust register
         if power > 0:
             # Estimate daily consumption and cost
             daily_kwh = (power / 1000) * 24  # Very rough estimate
@@ -507,42 +457,28 @@ class GrantAerona3DailyCostSensor(GrantAerona3BaseSensor):
         
         return 0
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        return {
-            "electricity_rate": "0.30 GBP/kWh",
-            "note": "Estimated cost - set up utility_meter for accurate tracking"
-        }
+        return _DAILY_COST_ATTRIBUTES
 
 
-class GrantAerona3MonthlyCostSensor(GrantAerona3BaseSensor):
+class GrantAerona3MonthlyCostSensor(GrantAerona3CalculatedSensor):
     """Grant Aerona3 monthly cost sensor with ashp_ prefix."""
 
-    def __init__(
-        self,
-        coordinator: GrantAerona3Coordinator,
-        config_entry: ConfigEntry,
-    ) -> None:
-        """Initialize the monthly cost sensor with ashp_ prefix."""
-        super().__init__(coordinator, config_entry)
-        self._attr_name = "ASHP Monthly Cost Projection"
-        self._attr_unique_id = f"ashp_{config_entry.entry_id}_monthly_cost_projection"
-        self.entity_id = "sensor.ashp_monthly_cost_projection"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_native_unit_of_measurement = "GBP"
-        self._attr_icon = "mdi:calendar-month"
-
-    @property
-    def native_value(self) -> Optional[float]:
+    _key = "monthly_cost_projection"
+    _attr_name = "ASHP Monthly Cost Projection"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "GBP"
+    _attr_icon = "mdi:calendar-month"
+
+    def _compute_native_value(self) -> Optional[float]:
         """Calculate projected monthly cost."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
         
         # Basic monthly projection
-        input_regs = self.coordinator.data.get("input_registers", {})
-        
-        power = input_regs.get(5, 0)  # Adjust register
+        power = data["input_registers"].get(5, 0)  # Adjust register
         if power > 0:
             # Estimate monthly consumption and cost
             monthly_kwh = (power / 1000) * 24 * 30  # Very rough estimate
@@ -551,11 +487,18 @@ class GrantAerona3MonthlyCostSensor(GrantAerona3BaseSensor):
         
         return 0
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
+    def _build_extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        return {
-            "electricity_rate": "0.30 GBP/kWh",
-            "projection_method": "current_power_x30_days",
-            "note": "Projection based on current consumption - actual costs may vary"
-        }
\ No newline at end of file
+        return _MONTHLY_COST_ATTRIBUTES
+
+
+# Calculated sensors created for every config entry
+_CALCULATED_SENSOR_CLASSES = (
+    GrantAerona3PowerSensor,
+    GrantAerona3EnergySensor,
+    GrantAerona3COPSensor,
+    GrantAerona3EfficiencySensor,
+    GrantAerona3WeatherCompSensor,
+    GrantAerona3DailyCostSensor,
+    GrantAerona3MonthlyCostSensor,
+)